@@ -1,26 +1,43 @@
 from __future__ import annotations
 
-import socket
+import asyncio
+import atexit
+import hashlib
+import hmac
+import io
+import json
+import queue
+import threading
 import time
+import traceback
 from dataclasses import dataclass, field
 from typing import Literal, List, Optional
 
-import csv
-from datetime import datetime
-from collections import deque
 from pathlib import Path
 import os
 
-from flask import Flask, render_template_string
+from flask import Flask, Response, request
 from flask_httpauth import HTTPBasicAuth
+from markupsafe import Markup, escape
 from werkzeug.security import generate_password_hash, check_password_hash
-from icmplib import ping
+from icmplib import async_ping
 import yaml
 
 
+# Prefer the libyaml-backed loader; fall back to pure Python if PyYAML was
+# built without it.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 CheckType = Literal["ping", "tcp"]
 
 
+def _csv_field(value: str) -> str:
+    # Same result as csv.writer's QUOTE_MINIMAL; nearly every field is plain.
+    if any(c in value for c in ',"\r\n'):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
 @dataclass
 class Target:
     name: str
@@ -32,18 +49,48 @@ class Target:
     last_rtt_ms: Optional[float] = field(default=None)
     last_checked: Optional[float] = field(default=None)
     last_error: Optional[str] = field(default=None)
-    history: deque[str] = field(default_factory=lambda: deque(maxlen=100))
+    # Last HISTORY_SIZE results as a bitmask, newest in bit 0 (1 = UP).
+    history_bits: int = field(default=0, init=False)
+    history_len: int = field(default=0, init=False)
+    # UP results within each of UPTIME_WINDOWS, kept in step by record_status.
+    up_counters: dict[int, int] = field(
+        default_factory=lambda: dict.fromkeys(UPTIME_WINDOWS, 0), init=False
+    )
+    # name,host,type,port, — the part of every log row that never changes.
+    _csv_prefix: str = field(init=False, repr=False)
+    # The same fields as dashboard table cells, escaped once up front.
+    _row_prefix: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        fixed = [str(v) for v in (self.name, self.host, self.type, self.port or "")]
+        self._csv_prefix = "".join(_csv_field(v) + "," for v in fixed)
+        self._row_prefix = (
+            f"<td>{escape(self.name)}</td>"
+            f"<td><code>{escape(self.host)}</code></td>"
+            f"<td>{escape(self.type)}</td>"
+            f"<td>{escape(self.port) if self.port else '-'}</td>"
+        )
 
 
 CONFIG_PATH = Path("targets.yaml")
 LOG_PATH = Path("logs") / "status_log.csv"
+CHECK_INTERVAL = 10  # seconds between probe cycles
+
+# Uptime is reported over these windows, measured in checks.
+UPTIME_WINDOW = 100
+UPTIME_WINDOW_24H = 24 * 60 * 60 // CHECK_INTERVAL
+UPTIME_WINDOWS = (UPTIME_WINDOW, UPTIME_WINDOW_24H)
+HISTORY_SIZE = max(UPTIME_WINDOWS)
+_HISTORY_MASK = (1 << HISTORY_SIZE) - 1
+
+EVENTS_KEEPALIVE = 15  # seconds of silence before an /events keepalive
 
 
 def load_targets() -> List[Target]:
     if not CONFIG_PATH.exists():
         raise FileNotFoundError(f"Config file not found: {CONFIG_PATH}")
 
-    data = yaml.safe_load(CONFIG_PATH.read_text(encoding="utf-8"))
+    data = yaml.load(CONFIG_PATH.read_text(encoding="utf-8"), Loader=_YamlLoader)
     targets_conf = data.get("targets", [])
     targets: List[Target] = []
     for entry in targets_conf:
@@ -60,111 +107,309 @@ def load_targets() -> List[Target]:
 
 TARGETS: List[Target] = load_targets()
 
+_cycle_lock = threading.Lock()
+_cycle_no = 0  # bumped after every completed cycle; doubles as the page ETag
+# Distinguishes this process's ETags from a previous run's, whose cycle
+# numbers started from 0 as well.
+_BOOT_ID = os.urandom(4).hex()
 
-def log_result(target: Target) -> None:
+# One queue per connected /events stream, fed after every scheduler cycle.
+_subscribers: List[queue.Queue[str]] = []
+_subscribers_lock = threading.Lock()
+
+
+LOG_HEADER = ["timestamp", "name", "host", "type", "port", "status", "rtt_ms", "error"]
+
+# Keep the log open for the life of the process rather than reopening it on
+# every check. It is opened on the first flush, by whichever process actually
+# runs cycles, so importing the module (e.g. in the `flask run --debug`
+# reloader parent) leaves the file alone. O_APPEND makes the kernel place
+# every write at the end of the file, and the buffer collects a whole cycle's
+# rows so flush_log() hands them over in a single write(). Flushing every
+# cycle (rather than relying on atexit) keeps rows from being lost on
+# SIGTERM, e.g. `docker stop`. Rows are only written from inside
+# run_one_cycle, which already serialises cycles, so no lock is needed.
+_log_f: Optional[io.BufferedWriter] = None
+
+
+def _open_log() -> io.BufferedWriter:
     LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
-    is_new = not LOG_PATH.exists()
-    with LOG_PATH.open(mode="a", newline="") as f:
-        writer = csv.writer(f)
-        if is_new:
-            writer.writerow(
-                [
-                    "timestamp",
-                    "name",
-                    "host",
-                    "type",
-                    "port",
-                    "status",
-                    "rtt_ms",
-                    "error",
-                ]
+    fd = os.open(LOG_PATH, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    f = io.BufferedWriter(io.FileIO(fd, "a"), buffer_size=1 << 20)
+    if os.fstat(fd).st_size == 0:
+        f.write((",".join(LOG_HEADER) + "\r\n").encode())
+    atexit.register(f.close)
+    return f
+
+
+# Rows collected during a cycle; written in one go by flush_log(). Every row
+# in a cycle shares the timestamp taken when the cycle started.
+_pending_rows: List[str] = []
+_cycle_ts = ""
+
+
+def iso_utc(ts_ns: int) -> str:
+    # Same layout as datetime.utcnow().isoformat(), without building a datetime.
+    secs, ns = divmod(ts_ns, 1_000_000_000)
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(secs)) + f".{ns // 1000:06d}"
+
+
+def log_result(target: Target) -> None:
+    rtt = f"{target.last_rtt_ms:.3f}" if target.last_rtt_ms is not None else ""
+    error = _csv_field(target.last_error) if target.last_error else ""
+    _pending_rows.append(
+        f"{_cycle_ts},{target._csv_prefix}{target.status},{rtt},{error}\r\n"
+    )
+
+
+def flush_log() -> None:
+    global _log_f
+    if _log_f is None:
+        _log_f = _open_log()
+    _log_f.write("".join(_pending_rows).encode())
+    _pending_rows.clear()
+    _log_f.flush()
+
+
+async def acheck_pings(
+    targets: List[Target], count: int = 1, timeout: float = 1.0
+) -> None:
+    # One batch for every ping target, like icmplib.multiping, but a host
+    # that errors out only fails its own result instead of the whole batch.
+    results = await asyncio.gather(
+        *(
+            async_ping(
+                t.host,
+                count=count,
+                timeout=timeout,
+                interval=0.2,
+                privileged=False,
             )
-        writer.writerow(
-            [
-                datetime.utcnow().isoformat(),
-                target.name,
-                target.host,
-                target.type,
-                target.port or "",
-                target.status,
-                f"{target.last_rtt_ms:.3f}"
-                if target.last_rtt_ms is not None
-                else "",
-                target.last_error or "",
-            ]
-        )
+            for t in targets
+        ),
+        return_exceptions=True,
+    )
+
+    now = time.time()
+    for target, result in zip(targets, results):
+        if isinstance(result, BaseException):
+            target.status = "DOWN"
+            target.last_rtt_ms = None
+            target.last_error = str(result)
+        else:
+            target.status = "UP" if result.packet_loss < 1.0 else "DOWN"
+            target.last_rtt_ms = result.avg_rtt
+            target.last_error = None
+        target.last_checked = now
+        record_status(target)
 
 
-def check_ping(target: Target, count: int = 1, timeout: float = 1.0) -> None:
-    prev_status = target.status
-    try:
-        result = ping(
-            target.host,
-            count=count,
-            timeout=timeout,
-            interval=0.2,
-            privileged=False,
-        )
-        target.status = "UP" if result.packet_loss < 1.0 else "DOWN"
-        target.last_rtt_ms = result.avg_rtt
-        target.last_error = None
-        target.history.append(target.status)
-    except Exception as e:
-        target.status = "DOWN"
-        target.last_rtt_ms = None
-        target.last_error = str(e)
-        target.history.append(target.status)
-    finally:
-        target.last_checked = time.time()
-        log_result(target)
-
-
-def check_tcp(target: Target, timeout: float = 1.0) -> None:
-    prev_status = target.status
-
-    if target.port is None:
-        target.status = "DOWN"
-        target.last_error = "TCP check requires port"
-        target.last_checked = time.time()
-        target.history.append(target.status)
-        log_result(target)
+async def _tcp_connect(host: str, port: int) -> float:
+    start = time.perf_counter_ns()
+    _, writer = await asyncio.open_connection(host, port)
+    end = time.perf_counter_ns()
+    writer.close()
+    return (end - start) / 1e6
+
+
+async def acheck_tcps(targets: List[Target], timeout: float = 1.0) -> None:
+    # Start every connect at once and wait on a single shared deadline;
+    # whatever has not connected by then is DOWN.
+    probes = []
+    for target in targets:
+        if target.port is None:
+            target.status = "DOWN"
+            target.last_error = "TCP check requires port"
+            target.last_checked = time.time()
+            record_status(target)
+        else:
+            probes.append(
+                (target, asyncio.create_task(_tcp_connect(target.host, target.port)))
+            )
+    if not probes:
         return
 
-    start = time.perf_counter_ns()
-    try:
-        with socket.create_connection((target.host, target.port), timeout=timeout):
-            end = time.perf_counter_ns()
+    _, pending = await asyncio.wait([task for _, task in probes], timeout=timeout)
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+
+    now = time.time()
+    for target, task in probes:
+        if task in pending:
+            target.status = "DOWN"
+            target.last_rtt_ms = None
+            target.last_error = "timed out"
+        elif task.exception() is not None:
+            target.status = "DOWN"
+            target.last_rtt_ms = None
+            target.last_error = str(task.exception())
+        else:
             target.status = "UP"
-            target.last_rtt_ms = (end - start) / 1e6
+            target.last_rtt_ms = task.result()
             target.last_error = None
-            target.history.append(target.status)
-    except Exception as e:
-        target.status = "DOWN"
-        target.last_rtt_ms = None
-        target.last_error = str(e)
-        target.history.append(target.status)
-    finally:
-        target.last_checked = time.time()
-        log_result(target)
+        target.last_checked = now
+        record_status(target)
 
 
-def run_one_cycle() -> None:
+async def _run_checks() -> None:
+    ping_targets = [t for t in TARGETS if t.type == "ping"]
+    tcp_targets = [t for t in TARGETS if t.type == "tcp"]
+    await asyncio.gather(acheck_pings(ping_targets), acheck_tcps(tcp_targets))
+    # Log once every batch is done, in targets.yaml order.
     for t in TARGETS:
-        if t.type == "ping":
-            check_ping(t)
-        elif t.type == "tcp":
-            check_tcp(t)
+        if t.type in ("ping", "tcp"):
+            log_result(t)
 
 
-def uptime_percent(target: Target) -> float:
-    if not target.history:
+def run_one_cycle() -> None:
+    global _cycle_no, _cycle_ts
+    # All probes share one event loop; the lock keeps concurrent callers
+    # from probing the same targets twice.
+    with _cycle_lock:
+        _cycle_ts = iso_utc(time.time_ns())
+        asyncio.run(_run_checks())
+        flush_log()
+        _cycle_no += 1
+
+
+def record_status(target: Target) -> None:
+    up = 1 if target.status == "UP" else 0
+    bits = target.history_bits
+    for window in UPTIME_WINDOWS:
+        # Once a window is full, the oldest result in it drops out.
+        if target.history_len >= window:
+            target.up_counters[window] -= (bits >> (window - 1)) & 1
+        target.up_counters[window] += up
+    target.history_bits = ((bits << 1) | up) & _HISTORY_MASK
+    target.history_len = min(target.history_len + 1, HISTORY_SIZE)
+
+
+def uptime_percent(target: Target, window: int = UPTIME_WINDOW) -> float:
+    checks = min(target.history_len, window)
+    if not checks:
         return 0.0
-    up = sum(1 for s in target.history if s == "UP")
-    return (up / len(target.history)) * 100.0
+    return 100.0 * target.up_counters[window] / checks
+
+
+def build_rows() -> List[tuple]:
+    # (status, rtt_ms, uptime, uptime_24h, last_checked, error) for every
+    # target, in TARGETS order. The fixed fields come from Target._row_prefix.
+    rows = []
+    for t in TARGETS:
+        rows.append(
+            (
+                t.status,
+                t.last_rtt_ms,
+                uptime_percent(t),
+                uptime_percent(t, UPTIME_WINDOW_24H),
+                t.last_checked,
+                t.last_error,
+            )
+        )
+    return rows
+
+
+_ROW_CLASS = {"UP": "table-success", "DOWN": "table-danger"}
+_PILL_CLASS = {"UP": "status-up", "DOWN": "status-down"}
+
+
+def render_rows() -> Markup:
+    # Table body for the dashboard: each target's precomputed static cells
+    # followed by the cells that change every cycle.
+    parts = []
+    for t, (status, rtt, uptime, uptime_24h, last_checked, error) in zip(
+        TARGETS, build_rows()
+    ):
+        parts.append(
+            f'<tr class="{_ROW_CLASS.get(status, "table-secondary")}">'
+            f"{t._row_prefix}"
+            f'<td><span class="status-pill {_PILL_CLASS.get(status, "status-unknown")}">'
+            f"{status}</span></td>"
+            f"<td>{f'{rtt:.2f}' if rtt is not None else '-'}</td>"
+            f"<td>{uptime:.1f}</td>"
+            f"<td>{uptime_24h:.1f}</td>"
+            f"<td>{int(last_checked) if last_checked else '-'}</td>"
+            f"<td>{escape(error) if error else '-'}</td>"
+            "</tr>"
+        )
+    return Markup("\n".join(parts))
+
+
+def snapshot() -> List[dict]:
+    return [
+        {
+            "name": t.name,
+            "status": status,
+            "last_rtt_ms": rtt,
+            "uptime": uptime,
+            "uptime_24h": uptime_24h,
+            "last_checked": last_checked,
+            "last_error": error,
+        }
+        for t, (status, rtt, uptime, uptime_24h, last_checked, error) in zip(
+            TARGETS, build_rows()
+        )
+    ]
+
+
+def publish_snapshot() -> None:
+    with _subscribers_lock:
+        if not _subscribers:
+            return
+        data = json.dumps(snapshot())
+        for q in _subscribers:
+            try:
+                q.put_nowait(data)
+            except queue.Full:
+                # Viewer is not keeping up; it will catch up on a later cycle.
+                pass
+
+
+def _scheduler() -> None:
+    # Start cycles on a fixed CHECK_INTERVAL grid rather than sleeping a full
+    # interval after each one, so probe time doesn't stretch the cadence
+    # (and the check-count uptime windows) out.
+    next_run = time.monotonic()
+    while True:
+        try:
+            run_one_cycle()
+            publish_snapshot()
+        except Exception:
+            traceback.print_exc()
+        next_run += CHECK_INTERVAL
+        now = time.monotonic()
+        if next_run < now - CHECK_INTERVAL:
+            # Fell more than a cycle behind (e.g. the host was suspended);
+            # resume from now instead of firing a burst of catch-up cycles.
+            next_run = now
+        time.sleep(max(0.0, next_run - now))
+
+
+_scheduler_started = False
+_scheduler_start_lock = threading.Lock()
+
+
+def start_scheduler() -> None:
+    global _scheduler_started
+    with _scheduler_start_lock:
+        if _scheduler_started:
+            return
+        _scheduler_started = True
+    threading.Thread(target=_scheduler, name="probe-scheduler", daemon=True).start()
 
 
 app = Flask(__name__)
 
+
+@app.before_request
+def _ensure_scheduler():
+    # Start probing on the first request rather than at import, so a plain
+    # `import monitor` or the `flask run --debug` reloader parent (which
+    # never serves requests) doesn't run a second scheduler.
+    if not _scheduler_started:
+        start_scheduler()
+
 # ---------- Basic Auth setup ----------
 
 auth = HTTPBasicAuth()
@@ -174,9 +419,30 @@ users = {
     "admin": generate_password_hash("ChangeThisPassword")
 }
 
+# Browsers resend Basic credentials on every request (including each page
+# load and /events reconnect), and check_password_hash is deliberately slow.
+# Remember a SHA-256 of the last password that verified for each user for a
+# few minutes so repeat requests skip the full hash check.
+AUTH_CACHE_TTL = 300  # seconds
+_auth_cache: dict[str, tuple[bytes, float]] = {}
+
+
 @auth.verify_password
 def verify_password(username, password):
-    if username in users and check_password_hash(users.get(username), password):
+    if username not in users:
+        return None
+
+    digest = hashlib.sha256(password.encode()).digest()
+    cached = _auth_cache.get(username)
+    if (
+        cached is not None
+        and time.monotonic() - cached[1] < AUTH_CACHE_TTL
+        and hmac.compare_digest(cached[0], digest)
+    ):
+        return username
+
+    if check_password_hash(users.get(username), password):
+        _auth_cache[username] = (digest, time.monotonic())
         return username
 
 # ---------- HTML Template with Bootstrap ----------
@@ -187,14 +453,11 @@ TEMPLATE = """
   <head>
     <meta charset="utf-8">
     <title>Host & Service Monitor</title>
-    <meta http-equiv="refresh" content="10">
 
-    <!-- Bootstrap CSS -->
+    <!-- Bootstrap CSS, served locally (see static/) -->
     <link
       rel="stylesheet"
-      href="https://cdn.jsdelivr.net/npm/bootstrap@4.6.2/dist/css/bootstrap.min.css"
-      integrity="sha384-GTVjCwVYxZ1dQc5sKXc5teLoI0lp4rWuIwoMvVJE9idh+NROGy4nQJ5c8NyEJD7B"
-      crossorigin="anonymous"
+      href="{{ url_for('static', filename='bootstrap-4.6.2.min.css') }}"
     />
 
     <style>
@@ -217,15 +480,15 @@ TEMPLATE = """
       <div class="d-flex justify-content-between align-items-center mb-3">
         <div>
           <h1 class="h3 mb-0">Host & Service Monitor</h1>
-          <p class="small-text mb-0">Auto-refreshes every 10 seconds.</p>
+          <p class="small-text mb-0">Updates live as checks complete.</p>
         </div>
         <div class="text-right small-text">
-          <div>Total targets: {{ targets|length }}</div>
+          <div>Total targets: {{ target_count }}</div>
         </div>
       </div>
 
       <div class="table-responsive">
-        <table class="table table-hover table-sm">
+        <table id="targets" class="table table-hover table-sm">
           <thead class="thead-light">
             <tr>
               <th>Name</th>
@@ -235,67 +498,119 @@ TEMPLATE = """
               <th>Status</th>
               <th>RTT (ms)</th>
               <th>Uptime (%)</th>
+              <th>Uptime 24h (%)</th>
               <th>Last Checked (epoch)</th>
               <th>Error</th>
             </tr>
           </thead>
           <tbody>
-            {% for t in targets %}
-            <tr
-              class="
-                {% if t.status == 'UP' %}table-success
-                {% elif t.status == 'DOWN' %}table-danger
-                {% else %}table-secondary
-                {% endif %}
-              "
-            >
-              <td>{{ t.name }}</td>
-              <td><code>{{ t.host }}</code></td>
-              <td>{{ t.type }}</td>
-              <td>{{ t.port if t.port else '-' }}</td>
-              <td>
-                {% if t.status == 'UP' %}
-                  <span class="status-pill status-up">UP</span>
-                {% elif t.status == 'DOWN' %}
-                  <span class="status-pill status-down">DOWN</span>
-                {% else %}
-                  <span class="status-pill status-unknown">UNKNOWN</span>
-                {% endif %}
-              </td>
-              <td>{{ '%.2f'|format(t.last_rtt_ms) if t.last_rtt_ms is not none else '-' }}</td>
-              <td>{{ '%.1f'|format(uptime_percent(t)) }}</td>
-              <td>
-                {% if t.last_checked %}
-                  {{ t.last_checked | int }}
-                {% else %}
-                  -
-                {% endif %}
-              </td>
-              <td>{{ t.last_error if t.last_error else '-' }}</td>
-            </tr>
-            {% endfor %}
+            {{ table_rows }}
           </tbody>
         </table>
       </div>
     </div>
 
-    <!-- Optional Bootstrap JS -->
-    <script src="https://code.jquery.com/jquery-3.5.1.slim.min.js"
-            integrity="sha384-DfXdXrZBOqVakiobP6KyHR+Y6z3Y0JVpaz6RtZpmjHtkobaN6D+PfYZ7R6pujISi"
-            crossorigin="anonymous"></script>
-    <script src="https://cdn.jsdelivr.net/npm/bootstrap@4.6.2/dist/js/bootstrap.bundle.min.js"
-            integrity="sha384-Fy6S3B9q64WdZWQUiU+q4/2LcT9gC1XwjlzAIXazhbugzuDUFcPRl1bQY70dNDO7"
-            crossorigin="anonymous"></script>
+    <script>
+      // Patch the table in place from the /events stream instead of
+      // reloading the whole page.
+      (function () {
+        var ROW_CLASS = {UP: "table-success", DOWN: "table-danger"};
+        var PILL_CLASS = {UP: "status-up", DOWN: "status-down"};
+
+        function render(snapshot) {
+          var rows = document.querySelectorAll("#targets tbody tr");
+          snapshot.forEach(function (t, i) {
+            var row = rows[i];
+            if (!row) { return; }
+            var cells = row.cells;
+            var status = t.status in ROW_CLASS ? t.status : "UNKNOWN";
+            row.className = ROW_CLASS[status] || "table-secondary";
+            var pill = cells[4].querySelector(".status-pill");
+            pill.className = "status-pill " + (PILL_CLASS[status] || "status-unknown");
+            pill.textContent = status;
+            cells[5].textContent = t.last_rtt_ms !== null ? t.last_rtt_ms.toFixed(2) : "-";
+            cells[6].textContent = t.uptime.toFixed(1);
+            cells[7].textContent = t.uptime_24h.toFixed(1);
+            cells[8].textContent = t.last_checked ? Math.floor(t.last_checked) : "-";
+            cells[9].textContent = t.last_error || "-";
+          });
+        }
+
+        var source = new EventSource("{{ url_for('events') }}");
+        source.onmessage = function (e) { render(JSON.parse(e.data)); };
+      })();
+    </script>
   </body>
 </html>
 """
 
 
+_TEMPLATE_COMPILED = app.jinja_env.from_string(TEMPLATE)
+
+# Static files (the vendored Bootstrap CSS) carry their version in the file
+# name, so browsers can cache them for good.
+STATIC_MAX_AGE = 365 * 24 * 60 * 60  # seconds
+
+
+@app.after_request
+def cache_static(response):
+    # Only real file responses; a 404 must not be cached for a year.
+    if request.endpoint == "static" and response.status_code in (200, 304):
+        response.cache_control.no_cache = None
+        response.cache_control.public = True
+        response.cache_control.max_age = STATIC_MAX_AGE
+        response.cache_control.immutable = True
+    return response
+
+
+# (cycle number, rendered page) for the most recently rendered cycle.
+_page_cache: tuple[int, bytes] = (-1, b"")
+_page_lock = threading.Lock()
+
+
 @app.route("/")
 @auth.login_required
 def index():
-    run_one_cycle()
-    return render_template_string(TEMPLATE, targets=TARGETS, uptime_percent=uptime_percent)
+    # Probing happens in the background scheduler and the page can only
+    # change when a cycle completes, so render at most once per cycle and
+    # serve the cached bytes in between. Later updates arrive over /events.
+    global _page_cache
+    version, html = _page_cache
+    if version != _cycle_no:
+        with _page_lock:
+            version, html = _page_cache
+            if version != _cycle_no:
+                version = _cycle_no
+                html = _TEMPLATE_COMPILED.render(
+                    table_rows=render_rows(), target_count=len(TARGETS)
+                ).encode()
+                _page_cache = (version, html)
+
+    resp = Response(html, mimetype="text/html")
+    resp.set_etag(f"{_BOOT_ID}-{version}")
+    return resp.make_conditional(request)
+
+
+@app.route("/events")
+@auth.login_required
+def events():
+    q: queue.Queue[str] = queue.Queue(maxsize=8)
+    with _subscribers_lock:
+        _subscribers.append(q)
+
+    def stream():
+        try:
+            while True:
+                try:
+                    yield f"data: {q.get(timeout=EVENTS_KEEPALIVE)}\n\n"
+                except queue.Empty:
+                    # Comment line; keeps proxies from closing an idle stream.
+                    yield ": keepalive\n\n"
+        finally:
+            with _subscribers_lock:
+                _subscribers.remove(q)
+
+    return Response(stream(), mimetype="text/event-stream")
 
 
 def print_status():